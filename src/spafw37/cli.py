@@ -8,6 +8,7 @@ from spafw37 import config_func as config
 from spafw37 import logging as logging_module
 from spafw37 import param
 from spafw37 import file as spafw37_file
+from spafw37 import help as help_module
 import spafw37.config
 from spafw37.constants.param import (
     PARAM_ALIASES,
@@ -15,6 +16,23 @@ from spafw37.constants.param import (
     PARAM_NAME,
 )
 
+# Pattern for a complete alias token: 1-2 dashes followed by word chars/hyphens
+_ALIAS_RE = re.compile(r'-{1,2}\w[\w-]*')
+
+# Pattern to detect whether a value contains any @file reference
+_FILE_REF_RE = re.compile(r'(?<!\w)@\S+')
+
+# Pattern to match @file references but not email addresses:
+# - Negative lookbehind (?<!\w) ensures @ is not preceded by word char
+# - @ symbol
+# - Capture group for filepath: chars that aren't whitespace or JSON/shell delimiters
+# This matches @path/to/file.txt but not user@example.com
+# Stops at }, ], ), comma, or whitespace to work inside JSON structures
+_FILE_TOKEN_RE = re.compile(r'(?<!\w)@([^\s\}\]\),]+)')
+
+# Characters that delimit a quoted token
+_QUOTE_CHARS = frozenset(('"', "'"))
+
 # Functions to run before parsing the command line
 _pre_parse_actions = []
 
@@ -25,31 +43,30 @@ def add_pre_parse_action(action):
     _pre_parse_actions.append(action)
 
 def add_pre_parse_actions(actions):
-    for action in actions:
-        _pre_parse_actions.append(action)
+    _pre_parse_actions.extend(actions)
 
 def add_post_parse_action(action):
     _post_parse_actions.append(action)
 
 def add_post_parse_actions(actions):
-    for action in actions:
-        _post_parse_actions.append(action)
+    _post_parse_actions.extend(actions)
 
 def _do_post_parse_actions():
-    for action in _post_parse_actions:
-        try:
+    try:
+        for action in _post_parse_actions:
             action()
-        except Exception as e:
-            logging_module.log_error(_scope='cli', _message=f'Post-parse action failed: {e}')
-            raise e
+    except Exception as e:
+        logging_module.log_error(_scope='cli', _message=f'Post-parse action failed: {e}')
+        raise
 
 
-def _parse_file_value(value):
+def _parse_file_value(value, file_contents=None):
     """Replace @file references in value with file contents.
     
     Scans the value string for @file tokens and replaces each with the
     contents of the referenced file. Multiple @file references in a single
-    value are all replaced.
+    value are all replaced, and each distinct file is read only once.
+    Substituted contents are not rescanned for further references.
     
     Distinguishes between file references (@filepath) and email addresses
     (user@domain.com) by checking that @ is not preceded by alphanumeric chars.
@@ -57,6 +74,8 @@ def _parse_file_value(value):
     
     Args:
         value: String potentially containing @file references
+        file_contents: Optional dict of file path to contents already read,
+                       shared across calls so each file is read only once
         
     Returns:
         String with @file tokens replaced by file contents
@@ -66,46 +85,55 @@ def _parse_file_value(value):
         PermissionError: If any referenced file isn't readable
         ValueError: If any referenced file is binary
     """
-    import re
-    
-    # Pattern to match @file references but not email addresses:
-    # - Negative lookbehind (?<!\w) ensures @ is not preceded by word char
-    # - @ symbol
-    # - Capture group for filepath: chars that aren't whitespace or JSON/shell delimiters
-    # This matches @path/to/file.txt but not user@example.com
-    # Stops at }, ], ), comma, or whitespace to work inside JSON structures
-    file_pattern = r'(?<!\w)@([^\s\}\]\),]+)'
-    
-    def replace_file_token(match):
-        """Replace a single @file token with its contents."""
+    # No '@' means no file references; skip the regex scan
+    if '@' not in value:
+        return value
+    
+    # Contents of files already read, so repeated references hit disk once
+    if file_contents is None:
+        file_contents = {}
+    
+    # Copy the text between matches and splice in file contents, joining once
+    parts = []
+    last_end = 0
+    for match in _FILE_TOKEN_RE.finditer(value):
         file_path = match.group(1)
-        # Use the file module's read function (includes @ prefix handling)
-        return spafw37_file._read_file_raw('@' + file_path)
-    
-    # Replace all @file tokens with their contents
-    return re.sub(file_pattern, replace_file_token, value)
+        contents = file_contents.get(file_path)
+        if contents is None:
+            # Use the file module's read function (includes @ prefix handling)
+            contents = spafw37_file._read_file_raw('@' + file_path)
+            file_contents[file_path] = contents
+        parts.append(value[last_end:match.start()])
+        parts.append(contents)
+        last_end = match.end()
+    
+    if not parts:
+        return value
+    parts.append(value[last_end:])
+    return ''.join(parts)
 
 
+def _run_pre_parse_action(action):
+    # Pre-parse failures are logged and skipped so later actions still run
+    try:
+        action()
+    except Exception as e:
+        logging_module.log_error(_scope='cli', _message=f'Pre-parse action failed: {e}')
+
 def _do_pre_parse_actions():
     for action in _pre_parse_actions:
-        try:
-            action()
-        except Exception as e:
-            logging_module.log_error(_scope='cli', _message=f'Pre-parse action failed: {e}')
-            pass
+        _run_pre_parse_action(action)
 
 def _tokenise_cli_args(args):
-    """Tokenize command-line arguments using regex pattern matching.
-    
-    Uses a comprehensive regex pattern to extract aliases and their values
-    from the joined args string.
+    """Tokenize command-line arguments in a single pass over the args list.
     
-    Pattern matches:
+    Walks the args left to right, classifying each arg as it is reached:
     - Aliases: --long-name, -s (1-2 dashes followed by word chars/hyphens)
-    - Values: Any of @file, quoted strings, JSON objects/arrays, or unquoted values
+    - Values: either attached with = (--name=value), or every following arg
+      up to the next dash-prefixed arg, joined with spaces
+      (e.g., --files a.txt b.txt gives "a.txt b.txt")
     
-    Commands are identified by removing all matched param patterns from the
-    args string - what remains are command tokens.
+    Any other arg is a command token.
     
     Args:
         args: List of command-line argument strings.
@@ -121,36 +149,39 @@ def _tokenise_cli_args(args):
         "commands": [],
         "params": []
     }
-    
-    # Join args into single string for regex processing
-    args_string = ' '.join(args)
-    remaining_string = args_string
-    
-    # Pattern matches alias and captures everything until next alias or end
-    # Group 1: alias (--name or -n) - must start after word boundary
-    # Group 2: value with = separator (e.g., --name=value)
-    # Group 3: value with space separator, capturing all non-dash-prefixed tokens
-    #          (e.g., --files a.txt b.txt captures "a.txt b.txt")
-    pattern = r'''(?:^|\s)((?:-{1,2})[\w][\w-]*)(?:=([^\s]+)|(?:\s+([^-\s][^\s]*(?:\s+[^-\s][^\s]*)*))?)?'''
-    
-    matches = re.finditer(pattern, args_string)
-    
-    for match in matches:
-        alias = match.group(1)
-        # Value can be in group 2 (=value) or group 3 (space-separated)
-        value = match.group(2) if match.group(2) else (match.group(3) if match.group(3) else None)
+    # Bound once so the loop body avoids repeated attribute lookups
+    add_param_entry = parsed["params"].append
+    add_commands = parsed["commands"].extend
+    match_alias = _ALIAS_RE.fullmatch
+    intern = sys.intern
+    
+    arg_count = len(args)
+    index = 0
+    while index < arg_count:
+        token = args[index]
+        index += 1
         
-        # Create new param entry for each occurrence
-        parsed["params"].append({
-            "alias": alias,
-            "value": value
-        })
+        if token.startswith('-'):
+            alias, separator, value = token.partition('=')
+            
+            if match_alias(alias):
+                if not separator:
+                    # Capture all following non-dash-prefixed args as the value
+                    value_start = index
+                    while index < arg_count and not args[index].startswith('-'):
+                        index += 1
+                    value = ' '.join(args[value_start:index]).strip()
+                
+                # Create new param entry for each occurrence; the alias is
+                # interned to match the interned registry keys by identity
+                add_param_entry({
+                    "alias": intern(alias),
+                    "value": value or None
+                })
+                continue
         
-        # Remove this match from the remaining string
-        remaining_string = remaining_string[:match.start()] + ' ' * (match.end() - match.start()) + remaining_string[match.end():]
-    
-    # Extract command tokens from remaining string
-    parsed["commands"] = remaining_string.split()
+        # Anything that is not an alias or a value is a command token
+        add_commands(token.split())
     
     return parsed
 
@@ -159,24 +190,32 @@ def _parse_file_references_in_params(param_entries):
     """Parse @file references in parameter values.
     
     Returns a new list with file references resolved. Does not modify
-    the original param_entries list.
+    the original param_entries list. When no value contains '@', the
+    original list is returned as-is.
     
     Args:
         param_entries: List of param dicts with structure [{'alias': '--name', 'value': 'val'}]
         
     Returns:
-        New list with same structure but @file values replaced with file contents
+        List with same structure but @file values replaced with file contents
     """
+    # Fast path: nothing to resolve without an '@' in any value
+    if not any(param_entry.get("value") and '@' in param_entry["value"] for param_entry in param_entries):
+        return param_entries
+    
     parsed_entries = []
     
+    # Shared across entries so a file referenced by several params is read once
+    file_contents = {}
+    
     for param_entry in param_entries:
         value = param_entry.get("value")
         
         # Check for file reference pattern
-        if value and re.search(r'(?<!\w)@\S+', value):
+        if value and '@' in value and _FILE_REF_RE.search(value):
             # Create new dict with parsed value
             parsed_entry = param_entry.copy()
-            parsed_entry["value"] = _parse_file_value(value)
+            parsed_entry["value"] = _parse_file_value(value, file_contents)
             parsed_entries.append(parsed_entry)
         else:
             # Append original entry unchanged
@@ -215,12 +254,15 @@ def _pre_parse_params(tokenized_args):
         tokenized_args: Pre-tokenized dict from _tokenise_cli_args() with structure:
                         {"commands": [...], "params": [{"alias": "--name", "value": "val1"}]}
     """
-    preparse_definitions = param.get_pre_parse_args()
-    if not preparse_definitions:
+    if not tokenized_args["params"]:
         return
     
-    # Build a map of preparse param names for quick lookup
-    preparse_names = {param_def.get(PARAM_NAME) for param_def in preparse_definitions}
+    # Names of preparse params for quick lookup
+    preparse_names = param.get_pre_parse_names()
+    if not preparse_names:
+        return
+    
+    get_param_by_alias = param.get_param_by_alias
     
     # Process params from tokenized args
     for param_entry in tokenized_args["params"]:
@@ -228,7 +270,7 @@ def _pre_parse_params(tokenized_args):
         value = param_entry["value"]
         
         # Get param definition for this alias
-        param_def = param.get_param_by_alias(alias)
+        param_def = get_param_by_alias(alias)
         if not param_def:
             continue
         
@@ -248,30 +290,30 @@ def handle_cli_args(args):
     Processes command-line arguments, setting config values and executing commands.
     """
     # Check for help command before processing
-    from spafw37 import help as help_module
     if help_module.handle_help_with_arg(args):
         return
     
     # Execute pre-parse actions (e.g., load persistent config)
     _do_pre_parse_actions()
     
-    # Tokenize arguments once using regex parser
-    # This produces a dict that can be used for both pre-parse and main parse
-    tokenized_args = _tokenise_cli_args(args)
-    
-    # Store original args for conflict checking
-    global _current_args
-    _current_args = args
-    
-    # Pre-parse specific params (e.g., logging/verbosity controls)
-    # before main parsing to configure behavior
-    _pre_parse_params(tokenized_args)
+    # With no args (e.g., a bare invocation that shows help) there is nothing
+    # to tokenize or parse; logging, prompts and the command queue still run
+    tokenized_args = None
+    if args:
+        # Tokenize arguments once in a single pass over the args list
+        # This produces a dict that can be used for both pre-parse and main parse
+        tokenized_args = _tokenise_cli_args(args)
+        
+        # Pre-parse specific params (e.g., logging/verbosity controls)
+        # before main parsing to configure behavior
+        _pre_parse_params(tokenized_args)
     
     # Apply logging configuration based on pre-parsed params
     logging_module.apply_logging_config()
 
-    # Parse command line arguments using regex tokenizer
-    _parse_command_line(tokenized_args)
+    # Parse command line arguments from the tokenized args
+    if tokenized_args is not None:
+        _parse_command_line(tokenized_args)
     
     # Prompt for params with PROMPT_ON_START timing
     param.prompt_params_for_start()
@@ -296,6 +338,7 @@ def _is_quoted_token(token):
     quoted by the caller. Shells normally strip quotes; this is primarily for
     testing or frontends that preserve quote characters.
     """
-    return (isinstance(token, str)
-            and len(token) >= 2
-            and ((token[0] == token[-1]) and token[0] in ('"', "'")))
+    if not isinstance(token, str) or len(token) < 2:
+        return False
+    first_char = token[0]
+    return first_char in _QUOTE_CHARS and token[-1] == first_char
@@ -1,3 +1,7 @@
+import heapq
+import itertools
+import sys
+
 # Constants used as keys in command definitions (tests use these constants as keys).
 from spafw37.constants.command import (
     COMMAND_NAME,
@@ -47,6 +51,14 @@ _phases = { PHASE_DEFAULT: [] }
 _phases_completed = []
 _command_queue = []
 _current_phase = None
+# Cached topological orders keyed by queued names, each stored with the
+# relations it was computed from so replaced or edited commands miss.
+_sort_order_cache = {}
+_SORT_ORDER_CACHE_SIZE = 64
+# Normalised relation tuples per command name, stored with the definition
+# and raw relation values they were read from so a replaced definition or
+# edited relation list is re-read.
+_command_relations = {}
 
 
 # Helper functions for inline object definitions
@@ -138,9 +150,9 @@ def get_all_commands():
 
 
 def is_command(arg):
-    if arg not in _commands.keys():
+    cmd = _commands.get(arg)
+    if cmd is None:
         return False
-    cmd = _commands[arg]
     return cycle.is_command_invocable(cmd)
 
 
@@ -182,9 +194,6 @@ def get_first_queued_command_name():
 def add_commands(command_list):
     """
     Register a list of command dictionaries into the module registry.
-
-    This also collects required params into the module-level _required_params
-    list (avoiding duplicates).
     """
     for cmd in command_list:
         add_command(cmd)
@@ -366,10 +375,55 @@ def _store_command(cmd):
                 "or only one should be provided.".format(name)
             )
     
+    # Intern names so registry, queue and graph lookups compare by identity
+    name = cmd[COMMAND_NAME] = sys.intern(name)
     _commands[name] = cmd
+    _get_command_relations(cmd)
     cycle.register_cycle(cmd, _commands)
 
 
+def _intern_names(names):
+    """Return command names as a tuple of interned strings.
+    
+    Args:
+        names: List of command names, or None
+    
+    Returns:
+        Tuple of names; string entries are interned.
+    """
+    return tuple(sys.intern(n) if isinstance(n, str) else n for n in names or ())
+
+
+def _get_command_relations(cmd):
+    """Return the normalised ordering relations of a command.
+    
+    Relations are cached by name and re-read whenever the definition is
+    replaced or its relation lists are changed, so edits made through
+    get_command() still affect ordering.
+    
+    Args:
+        cmd: Command definition dict
+    
+    Returns:
+        Tuple of (goes_after, require_before, goes_before, next_commands),
+        each a tuple of command names. The same tuple object is returned
+        while the relations are unchanged.
+    """
+    name = cmd.get(COMMAND_NAME)
+    raw_relations = (
+        tuple(cmd.get(COMMAND_GOES_AFTER) or ()),
+        tuple(cmd.get(COMMAND_REQUIRE_BEFORE) or ()),
+        tuple(cmd.get(COMMAND_GOES_BEFORE) or ()),
+        tuple(cmd.get(COMMAND_NEXT_COMMANDS) or ()),
+    )
+    cached = _command_relations.get(name)
+    if cached is not None and cached[0] is cmd and cached[1] == raw_relations:
+        return cached[2]
+    relations = tuple(_intern_names(names) for names in raw_relations)
+    _command_relations[name] = (cmd, raw_relations, relations)
+    return relations
+
+
 def add_command(cmd):
     """Register a command for execution.
     
@@ -413,55 +467,42 @@ def _execute_command(cmd):
 
 def _queue_add(name, queued):
     """
-    Recursively add a command and its related commands to the queue in the
-    correct order. Uses queued set to avoid duplicates and infinite cycles.
+    Add a command and its related commands to the queue in the correct order.
+    Uses queued set to avoid duplicates and infinite cycles.
+
+    Walks the related commands depth-first with an explicit stack rather than
+    recursion, so long dependency chains cannot hit the recursion limit. Each
+    command's relations are visited in the order GOES_AFTER, REQUIRE_BEFORE,
+    GOES_BEFORE, NEXT_COMMANDS.
     """
-    if name in queued:
-        return
-    if _is_command_finished(name):
-        return
-    cmd = get_command(name)
-    if not cmd:
-        raise KeyError(f"Command '{name}' not found in registry.")
+    stack = [name]
+    while stack:
+        name = stack.pop()
+        if name in queued:
+            continue
+        if _is_command_finished(name):
+            continue
+        cmd = get_command(name)
+        if not cmd:
+            raise KeyError(f"Command '{name}' not found in registry.")
 
-    # Append this command if not already queued
-    if name not in queued:
         _command_queue.append(cmd)
         queued.add(name)
-    if cmd.get(COMMAND_PHASE):
-        _phase = cmd.get(COMMAND_PHASE)
-        if _phase not in _phases:
-            raise KeyError(f"Phase '{_phase}' not recognised.")
-        if _phase in _phases_completed:
-            raise ValueError(f"Cannot add command '{name}' to completed phase '{_phase}'.") 
-        if cmd not in _phases[_phase]:
-            _phases[_phase].append(cmd)
-
-    # Ensure commands that this command must come after are queued
-    for dep in cmd.get(COMMAND_GOES_AFTER, []) or []:
-        if dep not in _commands:
-            raise KeyError(f"Command '{dep}' not found in registry.")
-        _queue_add(dep, queued)
-
-    # REQUIRE_BEFORE for this command means these prerequisites must be present
-    # before this command — queue those first.
-    for prereq in cmd.get(COMMAND_REQUIRE_BEFORE, []) or []:
-        if prereq not in _commands:
-            raise KeyError(f"Command '{prereq}' not found in registry.")
-        _queue_add(prereq, queued)
-
-    # If this command must come before certain commands, ensure they are queued
-    # after this command.
-    for after_target in cmd.get(COMMAND_GOES_BEFORE, []) or []:
-        if after_target not in _commands:
-            raise KeyError(f"Command '{after_target}' not found in registry.")
-        _queue_add(after_target, queued)
-
-    # NEXT_COMMANDS should be queued after the current command.
-    for next_name in cmd.get(COMMAND_NEXT_COMMANDS, []) or []:
-        if next_name not in _commands:
-            raise KeyError(f"Command '{next_name}' not found in registry.")
-        _queue_add(next_name, queued)
+        if cmd.get(COMMAND_PHASE):
+            _phase = cmd.get(COMMAND_PHASE)
+            if _phase not in _phases:
+                raise KeyError(f"Phase '{_phase}' not recognised.")
+            if _phase in _phases_completed:
+                raise ValueError(f"Cannot add command '{name}' to completed phase '{_phase}'.") 
+            if cmd not in _phases[_phase]:
+                _phases[_phase].append(cmd)
+
+        related = list(itertools.chain.from_iterable(_get_command_relations(cmd)))
+        for related_name in related:
+            if related_name not in _commands:
+                raise KeyError(f"Command '{related_name}' not found in registry.")
+        # Push in reverse so the first related command is visited first
+        stack.extend(reversed(related))
 
 
 def queue_command(name):
@@ -490,127 +531,153 @@ def _detect_cycle(graph):
     """
     Detect cycles in a directed graph using DFS.
     Returns the first cycle found as a list of nodes, or None if no cycle.
+
+    The walk uses an explicit stack of (node, neighbour iterator) pairs
+    instead of recursion, and tracks each node's position on the current
+    path so a cycle is sliced out without searching the path.
     """
     WHITE, GRAY, BLACK = 0, 1, 2
     colors = {node: WHITE for node in graph}
-    parent = {}
-    
-    def dfs(node, path):
-        if colors[node] == GRAY:
-            # Found a back edge, extract the cycle
-            cycle_start = path.index(node)
-            return path[cycle_start:] + [node]
-        if colors[node] == BLACK:
-            return None
-            
-        colors[node] = GRAY
-        path.append(node)
-        
-        for neighbor in graph[node]:
-            cycle = dfs(neighbor, path)
-            if cycle:
-                return cycle
-                
-        path.pop()
-        colors[node] = BLACK
-        return None
-    
-    for node in graph:
-        if colors[node] == WHITE:
-            cycle = dfs(node, [])
-            if cycle:
-                return cycle
+    
+    for root in graph:
+        if colors[root] != WHITE:
+            continue
+        path = [root]
+        path_pos = {root: 0}
+        colors[root] = GRAY
+        stack = [(root, iter(graph[root]))]
+        while stack:
+            node, neighbors = stack[-1]
+            for neighbor in neighbors:
+                if colors[neighbor] == GRAY:
+                    # Found a back edge, extract the cycle
+                    return path[path_pos[neighbor]:] + [neighbor]
+                if colors[neighbor] == WHITE:
+                    colors[neighbor] = GRAY
+                    path_pos[neighbor] = len(path)
+                    path.append(neighbor)
+                    stack.append((neighbor, iter(graph[neighbor])))
+                    break
+            else:
+                # All neighbours explored; node is not on any cycle from here
+                stack.pop()
+                path.pop()
+                del path_pos[node]
+                colors[node] = BLACK
     return None
 
 
 def _build_dependency_graph(names):
     """
     Build a directed graph (adjacency list) for the provided command names.
-    Edge A -> B means A must come before B.
-    Raises CircularDependencyError if cycles are detected.
-    
-    TODO: Improve error message to show the actual cycle path rather than
-    just listing remaining nodes when circular dependencies are detected.
+    Edge A -> B means A must come before B. Cycles are not checked here;
+    the topological sort reports them.
     """
     
-    graph = {n: set() for n in names}
-    for n in names:
+    graph = {n: [] for n in names}
+    for n in graph:
         cmd = get_command(n)
         if not cmd:
             continue
+        goes_after, require_before, goes_before, next_commands = _get_command_relations(cmd)
         # GOES_AFTER: dep must come before this command -> dep -> n
-        for dep in cmd.get(COMMAND_GOES_AFTER, []) or []:
+        for dep in goes_after:
             if dep in graph:
-                graph[dep].add(n)
+                graph[dep].append(n)
         # REQUIRE_BEFORE: prereq must come before this command -> prereq -> n
-        for prereq in cmd.get(COMMAND_REQUIRE_BEFORE, []) or []:
+        for prereq in require_before:
             if prereq in graph:
-                graph[prereq].add(n)
+                graph[prereq].append(n)
         # GOES_BEFORE: this command must come before target -> n -> target
-        for target in cmd.get(COMMAND_GOES_BEFORE, []) or []:
+        for target in goes_before:
             if target in graph:
-                graph[n].add(target)
+                graph[n].append(target)
         # NEXT_COMMANDS: this command must come before next -> n -> next
-        for nxt in cmd.get(COMMAND_NEXT_COMMANDS, []) or []:
+        for nxt in next_commands:
             if nxt in graph:
-                graph[n].add(nxt)
-
-    # Check for circular dependencies
-    cycle = _detect_cycle(graph)
-    if cycle:
-        cycle_str = " -> ".join(cycle)
-        raise CircularDependencyError(f"Circular dependency detected: {cycle_str}")
+                graph[n].append(nxt)
     
     return graph
 
 
-def _sort_command_queue(_command_queue=_command_queue):
+def _topological_order(names):
     """
-    Reorder _command_queue according to dependency relations using a stable
-    topological sort (Kahn's algorithm). Only sorts commands that are already
-    present in _command_queue.
+    Return names in dependency order using a stable topological sort
+    (Kahn's algorithm). Ties are broken by position in names.
     Raises CircularDependencyError if cycles are detected.
     """
-    if not _command_queue:
-        return
-    # Work with names for sorting
-    names = [c.get(COMMAND_NAME) for c in _command_queue if c.get(COMMAND_NAME)]
     graph = _build_dependency_graph(names)
+    # Without any ordering edges between distinct names the order is unchanged
+    if len(graph) == len(names) and not any(graph.values()):
+        return list(names)
 
     # compute in-degrees
-    indeg = {n: 0 for n in names}
+    indeg = {n: 0 for n in graph}
     for src, targets in graph.items():
         for t in targets:
             indeg[t] += 1
 
-    # Kahn's algorithm, keep stable order by selecting nodes in the order they
-    # originally appeared in the queue when indeg == 0.
+    # Kahn's algorithm, keep stable order by always selecting the ready node
+    # that appeared earliest in the original queue (heap keyed on index).
     result = []
-    zero_nodes = [n for n in names if indeg[n] == 0]
-
-    # Preserve original ordering for zero_nodes by sorting according to original index
     name_index = {n: i for i, n in enumerate(names)}
-    zero_nodes.sort(key=lambda x: name_index.get(x, 0))
+    zero_nodes = [(name_index[n], n) for n in names if indeg[n] == 0]
+    heapq.heapify(zero_nodes)
 
     while zero_nodes:
-        n = zero_nodes.pop(0)
+        _, n = heapq.heappop(zero_nodes)
         result.append(n)
-        for m in sorted(graph.get(n, []), key=lambda x: name_index.get(x, 0)):
+        for m in graph.get(n, ()):
             indeg[m] -= 1
             if indeg[m] == 0:
-                inserted = False
-                for i, z in enumerate(zero_nodes):
-                    if name_index.get(m, 0) < name_index.get(z, 0):
-                        zero_nodes.insert(i, m)
-                        inserted = True
-                        break
-                if not inserted:
-                    zero_nodes.append(m)
-
-    # If there is a cycle, the result will be incomplete
+                heapq.heappush(zero_nodes, (name_index[m], m))
+
+    # If there is a cycle, the result will be incomplete; only then walk the
+    # graph again to report the cycle path.
     if len(result) != len(names):
-        remaining_names = [n for n in names if n not in result]
+        cycle = _detect_cycle(graph)
+        if cycle:
+            cycle_str = " -> ".join(cycle)
+            raise CircularDependencyError(f"Circular dependency detected: {cycle_str}")
+        sorted_names = set(result)
+        remaining_names = [n for n in names if n not in sorted_names]
         raise CircularDependencyError(f"Circular dependency prevents proper ordering. Remaining commands: {remaining_names}")
+    return result
+
+
+def _get_sorted_order(names):
+    """
+    Return the topological order for names, reusing a cached order when the
+    same names were sorted before with the same command relations.
+    Raises CircularDependencyError if cycles are detected.
+    """
+    cache_key = tuple(names)
+    relations = tuple(
+        _get_command_relations(_commands[n]) if _commands.get(n) else None
+        for n in names)
+    cached = _sort_order_cache.get(cache_key)
+    # Unchanged relations are the same tuple objects, so this compares by identity
+    if cached is not None and cached[0] == relations:
+        return cached[1]
+    result = _topological_order(names)
+    if len(_sort_order_cache) >= _SORT_ORDER_CACHE_SIZE:
+        _sort_order_cache.clear()
+    _sort_order_cache[cache_key] = (relations, result)
+    return result
+
+
+def _sort_command_queue(_command_queue=_command_queue):
+    """
+    Reorder _command_queue according to dependency relations using a stable
+    topological sort (Kahn's algorithm). Only sorts commands that are already
+    present in _command_queue.
+    Raises CircularDependencyError if cycles are detected.
+    """
+    if not _command_queue:
+        return
+    # Work with names for sorting
+    names = [c.get(COMMAND_NAME) for c in _command_queue if c.get(COMMAND_NAME)]
+    result = _get_sorted_order(names)
 
     # Rebuild _command_queue with dicts in final_order
     name_to_cmd = {c.get(COMMAND_NAME): c for c in _command_queue if c.get(COMMAND_NAME)}
@@ -645,7 +712,7 @@ def _verify_command_params(cmd, _skip_runtime_only=True):
     for _param in cmd.get(COMMAND_REQUIRED_PARAMS, []):
         if (_skip_runtime_only and param.is_runtime_only_param(param.get_param_by_name(_param))):
             continue
-        if _param not in config.list_config_params():
+        if not config.has_config_value(_param):
             cmd_name = cmd.get(COMMAND_NAME)
             raise CommandParameterError(
                 f"Missing required parameter '{_param}' for command '{cmd_name}'",
@@ -659,7 +726,8 @@ def _record_finished_command(command_name):
 
 def _trim_queue():
     # Remove finished commands from the queue
-    _command_queue[:] = [cmd for cmd in _command_queue if cmd.get(COMMAND_NAME) not in _finished_commands]
+    finished = set(_finished_commands)
+    _command_queue[:] = [cmd for cmd in _command_queue if cmd.get(COMMAND_NAME) not in finished]
 
 def _recalculate_queue(_command_queue=_command_queue):
     # Add any commands triggered by params set before execution
@@ -669,15 +737,32 @@ def _recalculate_queue(_command_queue=_command_queue):
 
 def _add_triggered_commands():
     """Add commands to the queue that are triggered by currently set params."""
-    for param_name in config.list_config_params():
+    queued_names = {c.get(COMMAND_NAME) for c in _command_queue}
+    for param_name in config.iter_config_params():
         param_def = param.get_param_by_name(param_name)
         if not param_def:
             continue
         for cmd in _commands.values():
             trigger_param = cmd.get(COMMAND_TRIGGER_PARAM)
             if trigger_param == param_name:
-                if cmd not in _command_queue:
+                if cmd.get(COMMAND_NAME) not in queued_names:
+                    queue_start = len(_command_queue)
                     _queue_add(cmd.get(COMMAND_NAME), set())
+                    queued_names.update(c.get(COMMAND_NAME) for c in _command_queue[queue_start:])
+
+def _cycle_queue_add(cmd_def, temp_queue, commands_dict):
+    """Build a temp queue for cycle execution."""
+    temp_queue.append(cmd_def[COMMAND_NAME])
+
+
+def _cycle_sort_queue(temp_queue, commands_dict):
+    """Sort temp queue based on dependencies."""
+    # Convert names back to command defs for sorting
+    cmd_list = [commands_dict[name] for name in temp_queue if name in commands_dict]
+    _sort_command_queue(cmd_list)
+    # cmd_list is sorted in-place, return as names
+    return [c.get(COMMAND_NAME) for c in cmd_list]
+
 
 def run_command_queue():
     """Execute commands phase by phase according to _phase_order."""
@@ -697,26 +782,11 @@ def run_command_queue():
             cmd_name = cmd.get(COMMAND_NAME)
             log_info(_message=f"Starting command: {cmd_name}")
             param.prompt_params_for_command(cmd)
-            action = cmd.get(COMMAND_ACTION)
-            if not callable(action):
-                raise ValueError(f"Command '{cmd_name}' has no valid action to execute.")
-            action()
+            _execute_command(cmd)
             log_info(_message=f"Completed command: {cmd_name}")
             _record_finished_command(cmd_name) # Note that this command has finished
             
             # Execute cycle if present - provide simplified wrappers
-            def _cycle_queue_add(cmd_def, temp_queue, commands_dict):
-                """Build a temp queue for cycle execution."""
-                temp_queue.append(cmd_def[COMMAND_NAME])
-            
-            def _cycle_sort_queue(temp_queue, commands_dict):
-                """Sort temp queue based on dependencies."""
-                # Convert names back to command defs for sorting
-                cmd_list = [commands_dict[name] for name in temp_queue if name in commands_dict]
-                _sort_command_queue(cmd_list)
-                # cmd_list is sorted in-place, return as names
-                return [c.get(COMMAND_NAME) for c in cmd_list]
-            
             cycle.execute_cycle(
                 cmd, _commands, _execute_command, _cycle_queue_add, _cycle_sort_queue
             )
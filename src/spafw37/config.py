@@ -155,9 +155,10 @@ def get_config_list(name, default=None):
     value = _config.get(name)
     if value is None:
         return default if default is not None else []
-    if not isinstance(value, list):
-        return [value]
-    return value
+    # Exact type check first; fall back to isinstance for list subclasses
+    if type(value) is list or isinstance(value, list):
+        return value
+    return [value]
 
 
 def get_config_dict(name, default=None):
@@ -227,17 +228,27 @@ def set_config_list_value(value, bind_name):
         value: Value to append to the list.
         bind_name: Configuration key name.
     """
-    if bind_name not in _config:
-        _config[bind_name] = []
+    config_list = _config.setdefault(bind_name, [])
     if isinstance(value, list):
-        _config[bind_name].extend(value)
+        config_list.extend(value)
     else:
-        _config[bind_name].append(value)
+        config_list.append(value)
 
 
 def list_config_params():
     return list(_config.keys())
 
+def iter_config_params():
+    """Get a live view of configuration key names.
+    
+    Use instead of list_config_params() when only iterating, to avoid
+    copying the keys. The config must not be modified during iteration.
+    
+    Returns:
+        Keys view of the config dict.
+    """
+    return _config.keys()
+
 def list_config_items():
     return _config.items()
 
@@ -251,7 +262,8 @@ def is_verbose():
     Returns:
         True if verbose logging is enabled, False otherwise.
     """
-    return get_config_bool(LOG_VERBOSE_PARAM, False)
+    # Read _config directly; a missing or None value is False either way
+    return bool(_config.get(LOG_VERBOSE_PARAM))
 
 
 def is_silent():
@@ -260,4 +272,4 @@ def is_silent():
     Returns:
         True if silent mode is enabled, False otherwise.
     """
-    return get_config_bool(LOG_SILENT_PARAM, False)
+    return bool(_config.get(LOG_SILENT_PARAM))
@@ -7,10 +7,25 @@ from spafw37.constants.config import (
     CONFIG_INFILE_PARAM,
     CONFIG_OUTFILE_PARAM,
 )
+import copy
 import json
+import os
+import shutil
+import stat
+import tempfile
+import time
 
 _persistent_config = {}
 
+# Parsed config files keyed by path, each stored with the stat key it was
+# read at so an edited file is parsed again.
+_config_file_cache = {}
+_CONFIG_FILE_CACHE_SIZE = 16
+# Files modified more recently than this are not cached: a same-size rewrite
+# within the filesystem's timestamp granularity (2s on FAT) would keep the
+# same stat key.
+_CONFIG_FILE_CACHE_MIN_AGE_NS = 2 * 10**9
+
 # File to store persisting params
 _config_file = 'config.json'
 
@@ -50,8 +65,77 @@ def set_config_file(config_file):
     _config_file = config_file
 
 
+def _get_config_file_stat_key(file_path):
+    """Get the (mtime_ns, ctime_ns, inode, size) key used to detect config file changes.
+    
+    The ctime also changes on chmod and chown, so a permission change misses.
+    
+    Args:
+        file_path: Path to the config file.
+    
+    Returns:
+        Stat key tuple, or None if the path cannot be stat'ed or is not a
+        regular file.
+    """
+    try:
+        file_stat = os.stat(file_path)
+    except OSError:
+        return None
+    if not stat.S_ISREG(file_stat.st_mode):
+        return None
+    return (file_stat.st_mtime_ns, file_stat.st_ctime_ns, file_stat.st_ino, file_stat.st_size)
+
+
+def _cache_loaded_config(file_path, stat_key, loaded_config):
+    """Store a parsed config file in the cache if its stat key can be trusted.
+    
+    Args:
+        file_path: Expanded path the config was loaded from.
+        stat_key: Stat key the file was read at.
+        loaded_config: Parsed JSON config.
+    
+    Returns:
+        True if the config was cached, False otherwise.
+    """
+    if time.time_ns() - stat_key[0] < _CONFIG_FILE_CACHE_MIN_AGE_NS:
+        return False
+    if len(_config_file_cache) >= _CONFIG_FILE_CACHE_SIZE:
+        _config_file_cache.clear()
+    _config_file_cache[file_path] = (stat_key, loaded_config)
+    return True
+
+
+def _copy_loaded_config(loaded_config):
+    """Copy a cached parsed config so callers cannot mutate the cache.
+    
+    Scalar values are shared; nested lists and dicts are deep-copied.
+    
+    Args:
+        loaded_config: Parsed JSON config.
+    
+    Returns:
+        Copy of loaded_config safe to hand to callers.
+    """
+    if not isinstance(loaded_config, dict):
+        return copy.deepcopy(loaded_config)
+    return {
+        config_key: copy.deepcopy(value) if isinstance(value, (dict, list)) else value
+        for config_key, value in loaded_config.items()
+    }
+
+
 def load_config(config_file_in):
     if config_file_in:
+        # Check the cache before validating: validation opens and reads the
+        # start of the file, which for a typical config is all of it. A hit
+        # still checks the file is readable; only the binary sniff is skipped.
+        expanded_path = os.path.expanduser(config_file_in)
+        stat_key = _get_config_file_stat_key(expanded_path)
+        cached = _config_file_cache.get(expanded_path)
+        if (stat_key is not None and cached is not None and cached[0] == stat_key
+                and os.access(expanded_path, os.R_OK)):
+            return _copy_loaded_config(cached[1])
+        
         try:
             validated_path = spafw37_file._validate_file_for_reading(config_file_in)
         except FileNotFoundError:
@@ -64,13 +148,14 @@ def load_config(config_file_in):
             raise value_error
         
         try:
-            with open(validated_path, 'r') as file_handle:
+            # json.loads decodes UTF-8 bytes itself, with or without a BOM, so
+            # read raw bytes and skip the text-mode wrapper
+            with open(validated_path, 'rb') as file_handle:
                 content = file_handle.read()
-                if not content.strip():
-                    # Treat empty files as empty configuration
-                    return {}
-                file_handle.seek(0)
-                return json.loads(content)
+            if not content.strip():
+                # Treat empty files as empty configuration
+                return {}
+            loaded_config = json.loads(content)
         except FileNotFoundError:
             logging.log_error(_scope='config', _message=f"Config file '{config_file_in}' not found")
             raise FileNotFoundError(f"Config file '{config_file_in}' not found")
@@ -83,6 +168,10 @@ def load_config(config_file_in):
         except json.JSONDecodeError:
             logging.log_error(_scope='config', _message=f"Invalid JSON in config file '{config_file_in}'")
             raise ValueError(f"Invalid JSON in config file '{config_file_in}'")
+        # The cached dict must not be handed out, only a copy of it
+        if stat_key is not None and _cache_loaded_config(expanded_path, stat_key, loaded_config):
+            return _copy_loaded_config(loaded_config)
+        return loaded_config
     return {}
 
 
@@ -90,7 +179,7 @@ def load_config(config_file_in):
 def filter_temporary_config(config_dict):
     """Filter out non-persisted parameters from config dict.
     
-    Queries param.py for the list of config bind names that should not be persisted.
+    Queries param.py for the set of config bind names that should not be persisted.
     
     Args:
         config_dict: Dictionary to filter.
@@ -99,44 +188,198 @@ def filter_temporary_config(config_dict):
         Filtered dictionary without non-persisted parameters.
     """
     non_persisted_names = param.get_non_persisted_config_names()
+    # Nothing to drop: copy in C rather than filtering key by key
+    if non_persisted_names.isdisjoint(config_dict):
+        return dict(config_dict)
     return {config_key: config_value for config_key, config_value in config_dict.items() if config_key not in non_persisted_names}
 
 
-def save_config(config_file_out, config_dict):
-    if (config_file_out and filter_temporary_config(config_dict)):
+def _has_persisted_values(config_dict):
+    """Check whether any key in config dict would survive filtering.
+    
+    Same test as truthiness of filter_temporary_config(), without building
+    the filtered dict.
+    
+    Args:
+        config_dict: Dictionary to check.
+        
+    Returns:
+        True if at least one key is not a non-persisted parameter.
+    """
+    non_persisted_names = param.get_non_persisted_config_names()
+    return any(config_key not in non_persisted_names for config_key in config_dict)
+
+
+def save_config(config_file_out, config_dict, _already_filtered=False):
+    # Callers passing an already-filtered dict only need an emptiness check
+    has_values = config_dict if _already_filtered else _has_persisted_values(config_dict)
+    if (config_file_out and has_values):
+        # Serialise before opening the file: one write instead of one per
+        # encoder chunk, and an unserialisable value leaves the file untouched.
+        content = json.dumps(config_dict, indent=2)
+        # Resolve symlinks so the link target is updated, not the link
+        target_file = os.path.realpath(config_file_out)
+        if _config_file_has_content(target_file, content):
+            return
         try:
-            with open(config_file_out, 'w') as f:
-                json.dump(config_dict, f, indent=2)
+            _write_config_file_atomically(target_file, content)
         except (OSError, IOError) as e:
             logging.log_error(_scope='config', _message=f"Error writing to config file '{config_file_out}': {e}")
             raise IOError(f"Error writing to config file '{config_file_out}': {e}")
 
 
-def load_persistent_config():
-    """Load persistent configuration from file.
+def _write_config_file_atomically(target_file, content):
+    """Write config content to a temporary file and swap it into place.
     
-    Loads config.json and updates the runtime config. XOR validation is disabled
-    during loading since values were already validated when saved.
+    A failed write never leaves a truncated config behind. The temporary
+    file gets the existing file's mode and owner before the swap.
+    
+    Args:
+        target_file: Resolved path of the config file to write.
+        content: Serialised config text.
     """
-    loaded_config = load_config(_config_file)
-    _persistent_config.update(loaded_config)
+    try:
+        temp_fd, temp_file = tempfile.mkstemp(
+            prefix='.' + os.path.basename(target_file) + '.',
+            suffix='.tmp',
+            dir=os.path.dirname(target_file))
+    except OSError:
+        # No temporary file can be created beside the target (missing or
+        # read-only directory), so write in place instead
+        with open(target_file, 'w') as f:
+            f.write(content)
+        return
+    replaced = False
+    try:
+        try:
+            temp_handle = open(temp_fd, 'w')
+        except (OSError, IOError):
+            os.close(temp_fd)
+            raise
+        with temp_handle:
+            temp_handle.write(content)
+        _copy_file_permissions(target_file, temp_file)
+        os.replace(temp_file, target_file)
+        replaced = True
+    finally:
+        if not replaced:
+            _remove_file_quietly(temp_file)
+
+
+def _copy_file_permissions(source_file, dest_file):
+    """Give dest_file the mode and owner of source_file.
     
+    If source_file does not exist yet, dest_file gets the mode a plain open()
+    would have created it with. Changing the owner is best-effort.
+    
+    Args:
+        source_file: Existing config file, if any.
+        dest_file: Temporary file that will replace it.
+    """
+    try:
+        source_stat = os.stat(source_file)
+    except FileNotFoundError:
+        os.chmod(dest_file, 0o666 & ~_get_umask())
+        return
+    shutil.copymode(source_file, dest_file)
+    if hasattr(os, 'chown'):
+        try:
+            os.chown(dest_file, source_stat.st_uid, source_stat.st_gid)
+        except OSError:
+            pass
+
+
+def _get_umask():
+    """Get the process umask.
+    
+    The umask can only be read by setting it, so it is set and restored.
+    
+    Returns:
+        Current umask.
+    """
+    current_umask = os.umask(0)
+    os.umask(current_umask)
+    return current_umask
+
+
+def _config_file_has_content(file_path, content):
+    """Check whether a config file already holds exactly the given content.
+    
+    The file is only read when its size matches, so most changed saves
+    cost a single stat.
+    
+    Args:
+        file_path: Path to the config file.
+        content: Serialised config text about to be written.
+    
+    Returns:
+        True if the file exists with identical content, False otherwise.
+    """
+    try:
+        if os.path.getsize(file_path) != len(content):
+            return False
+        with open(file_path, 'r') as file_handle:
+            return file_handle.read() == content
+    except (OSError, UnicodeDecodeError):
+        return False
+
+
+def _remove_file_quietly(file_path):
+    """Remove a file, ignoring errors if it is missing or cannot be removed.
+    
+    Args:
+        file_path: Path to the file to remove.
+    """
+    try:
+        os.remove(file_path)
+    except OSError:
+        pass
+
+
+def _apply_loaded_config(loaded_config):
+    """Apply values loaded from a config file to the runtime config.
+    
+    Values are set through the param API so filters and persistence tracking
+    apply. XOR validation is disabled while loading since values were already
+    validated when saved.
+    
+    Args:
+        loaded_config: Dict of bind names to values, as read from a config file.
+    """
     # Disable XOR validation while loading to avoid false conflicts
     param._set_xor_validation_enabled(False)
     try:
         # Load config values through param API to trigger proper initialization
-        for config_key, value in loaded_config.items():
-            # Try to find param with this bind name and set through param API
-            try:
-                param.set_param(param_name=config_key, value=value)
-            except ValueError:
-                # If param not registered, set directly in config (backward compatibility)
-                config.set_config_value(config_key, value)
+        unset_values = param._set_config_values(loaded_config)
+        # Values with no registered param go directly into config (backward compatibility)
+        config.update_config(unset_values)
     finally:
         # Always re-enable XOR validation after loading
         param._set_xor_validation_enabled(True)
 
 
+def load_persistent_config():
+    """Load persistent configuration from file.
+    
+    Loads config.json and updates the runtime config. XOR validation is disabled
+    during loading since values were already validated when saved.
+    """
+    loaded_config = load_config(_config_file)
+    _persistent_config.update(loaded_config)
+    _apply_loaded_config(loaded_config)
+
+
+def load_persistent_config_if_present():
+    """Load persistent configuration only if the config file exists.
+    
+    Used as the startup pre-parse action so a first run without a config
+    file skips validation, the open attempt and the error logging that
+    load_persistent_config() performs for a missing file.
+    """
+    if os.path.isfile(os.path.expanduser(_config_file)):
+        load_persistent_config()
+
+
 def load_user_config():
     """Load user configuration from file specified by CONFIG_INFILE_PARAM.
     
@@ -149,29 +392,14 @@ def load_user_config():
         # Fall back to raw config if param not registered
         in_file = config.get_config_value(CONFIG_INFILE_PARAM)
     if in_file:
-        loaded_config = load_config(in_file)
-        
-        # Disable XOR validation while loading to avoid false conflicts
-        param._set_xor_validation_enabled(False)
-        try:
-            # Load config values through param API to trigger proper initialization
-            for config_key, value in loaded_config.items():
-                # Try to find param with this bind name and set through param API
-                try:
-                    param.set_param(param_name=config_key, value=value)
-                except ValueError:
-                    # If param not registered, set directly in config (backward compatibility)
-                    config.set_config_value(config_key, value)
-        finally:
-            # Always re-enable XOR validation after loading
-            param._set_xor_validation_enabled(True)
+        _apply_loaded_config(load_config(in_file))
 
 
 # Create a copy of _config excluding non-persisted names
 def get_filtered_config_copy():
     """Get a copy of runtime config excluding non-persisted parameters.
     
-    Queries param.py for the list of config bind names that should not be persisted.
+    Queries param.py for the set of config bind names that should not be persisted.
     
     Returns:
         Shallow copy of runtime config without non-persisted parameters.
@@ -188,7 +416,7 @@ def save_user_config():
         out_file = config.get_config_value(CONFIG_OUTFILE_PARAM)
     if out_file:
         # Save a filtered copy of the runtime config (exclude non-persisted params)
-        save_config(out_file, get_filtered_config_copy())
+        save_config(out_file, get_filtered_config_copy(), _already_filtered=True)
 
 
 def save_persistent_config():
@@ -110,7 +110,7 @@ param.add_params(_params_builtin)
 param.add_params(logging.LOGGING_PARAMS)
 command.add_commands(_commands_builtin)
 command.set_phases_order(config.get_phases_order())
-cli.add_pre_parse_actions([config_func.load_persistent_config])
+cli.add_pre_parse_actions([config_func.load_persistent_config_if_present])
 cli.add_post_parse_actions([config_func.save_persistent_config])
 
 # Register pre-parse arguments (params to parse before main CLI parsing)
@@ -23,13 +23,13 @@ def _deprecated(message):
         Decorator function that wraps the deprecated function.
     """
     def decorator(func):
+        func_name = func.__name__
         def wrapper(*args, **kwargs):
-            if not _suppress_deprecation_warnings:
-                func_name = func.__name__
-                if func_name not in _deprecated_warnings_shown:
-                    _deprecated_warnings_shown.add(func_name)
-                    from spafw37 import logging as spafw37_logging
-                    spafw37_logging.log_warning(_message=f"{func_name}() is deprecated. {message}")
+            # Shown set is checked on every call so clearing it re-arms the warning
+            if not _suppress_deprecation_warnings and func_name not in _deprecated_warnings_shown:
+                _deprecated_warnings_shown.add(func_name)
+                from spafw37 import logging as spafw37_logging
+                spafw37_logging.log_warning(_message=f"{func_name}() is deprecated. {message}")
             return func(*args, **kwargs)
         return wrapper
     return decorator
@@ -1,4 +1,5 @@
 import re
+import sys
 
 from spafw37 import logging
 
@@ -57,6 +58,11 @@ PATTERN_LONG_ALIAS = r"^--\w+(?:-\w+)*$"
 PATTERN_LONG_ALIAS_EQUALS_VALUE = r"^--\w+(?:-\w+)*=.+$"
 PATTERN_SHORT_ALIAS = r"^-\w{1,2}$"
 
+# Compiled forms of the patterns above, used by the alias predicates
+_LONG_ALIAS_RE = re.compile(PATTERN_LONG_ALIAS)
+_LONG_ALIAS_EQUALS_VALUE_RE = re.compile(PATTERN_LONG_ALIAS_EQUALS_VALUE)
+_SHORT_ALIAS_RE = re.compile(PATTERN_SHORT_ALIAS)
+
 # NOTE: Thread Safety - These module-level variables are not thread-safe.
 # This framework is designed for single-threaded CLI applications. If using
 # in a multi-threaded context, external synchronization is required.
@@ -64,6 +70,11 @@ _params = {}
 _param_aliases = {}
 _xor_list = {}
 
+# Bind name lookup cache (bind name -> param definition), filled on first lookup.
+# Entries are checked against _params before use, so a reset registry never
+# returns a stale definition.
+_bind_name_params = {}
+
 # Pre-parse arguments (params to parse before main CLI parsing)
 _preparse_args = []
 
@@ -79,6 +90,15 @@ _registration_mode = False
 # Module-level switch behaviour constant for registration mode
 _SWITCH_REGISTER = 'switch-register'  # Internal: Skip validation during registration
 
+# Param types that support PARAM_ALLOWED_VALUES validation
+_ALLOWED_VALUES_PARAM_TYPES = (PARAM_TYPE_TEXT, PARAM_TYPE_NUMBER, PARAM_TYPE_LIST)
+
+# Param types whose CLI values accumulate via join_param rather than set_param
+_JOINED_PARAM_TYPES = frozenset((PARAM_TYPE_LIST, PARAM_TYPE_DICT))
+
+# Recognised PARAM_PROMPT_REPEAT values
+_PROMPT_REPEAT_VALUES = (PROMPT_REPEAT_ALWAYS, PROMPT_REPEAT_IF_BLANK, PROMPT_REPEAT_NEVER)
+
 # Global prompt handler storage (None = use default handler)
 _global_prompt_handler = None
 
@@ -196,7 +216,7 @@ def _register_inline_param(param_def):
             # Register aliases if present
             aliases = param_def.get(PARAM_ALIASES, [])
             for alias in aliases:
-                _param_aliases[alias] = param_name
+                _param_aliases[sys.intern(alias)] = param_name
             # Register switch list if present (now normalized)
             if PARAM_SWITCH_LIST in param_def:
                 _set_param_xor_list(param_name, param_def[PARAM_SWITCH_LIST])
@@ -205,13 +225,13 @@ def _register_inline_param(param_def):
 
 
 def is_long_alias(arg):
-    return bool(re.match(PATTERN_LONG_ALIAS, arg))
+    return bool(_LONG_ALIAS_RE.match(arg))
 
 def is_long_alias_with_value(arg):
-    return bool(re.match(PATTERN_LONG_ALIAS_EQUALS_VALUE, arg))
+    return bool(_LONG_ALIAS_EQUALS_VALUE_RE.match(arg))
 
 def is_short_alias(arg):
-    return bool(re.match(PATTERN_SHORT_ALIAS, arg))
+    return bool(_SHORT_ALIAS_RE.match(arg))
 
 def _is_param_type(param, param_type):
     return param.get(PARAM_TYPE, PARAM_TYPE_TEXT) == param_type
@@ -296,8 +316,8 @@ def is_text_param(param_name=None, bind_name=None, alias=None):
 
 
 def is_alias(alias):
-    return bool(re.match(PATTERN_LONG_ALIAS, alias)
-                or re.match(PATTERN_SHORT_ALIAS, alias))
+    return bool(_LONG_ALIAS_RE.match(alias)
+                or _SHORT_ALIAS_RE.match(alias))
 
 def is_persistence_always(param):
     """Check if parameter has PARAM_PERSISTENCE_ALWAYS set.
@@ -322,19 +342,19 @@ def is_persistence_never(param):
     return param.get(PARAM_PERSISTENCE, None) == PARAM_PERSISTENCE_NEVER
 
 def get_non_persisted_config_names():
-    """Get list of config bind names that should never be persisted.
+    """Get set of config bind names that should never be persisted.
     
     Queries all registered parameters and returns the config bind names
     for those with PARAM_PERSISTENCE_NEVER.
     
     Returns:
-        List of config bind names that should not be persisted.
+        Set of config bind names that should not be persisted.
     """
-    non_persisted_names = []
+    non_persisted_names = set()
     for param_name, param_def in _params.items():
         if is_persistence_never(param_def):
             bind_name = _get_bind_name(param_def)
-            non_persisted_names.append(bind_name)
+            non_persisted_names.add(bind_name)
     return non_persisted_names
 
 def notify_persistence_change(param_name, value):
@@ -347,10 +367,24 @@ def notify_persistence_change(param_name, value):
         param_name: Name of the parameter.
         value: New value for the parameter.
     """
-    from spafw37 import config_func
     param_def = _get_param_definition(param_name)
-    if param_def and is_persistence_always(param_def):
-        bind_name = _get_bind_name(param_def)
+    if param_def:
+        _track_persistence_change(param_def, _get_bind_name(param_def), value)
+
+
+def _track_persistence_change(param_def, bind_name, value):
+    """Track a value change for an already-resolved parameter.
+    
+    Used by the setters, which have already resolved the definition and
+    computed its bind name, to avoid looking both up again.
+    
+    Args:
+        param_def: Parameter definition dict.
+        bind_name: Config bind name of the parameter.
+        value: New value for the parameter.
+    """
+    if is_persistence_always(param_def):
+        from spafw37 import config_func
         config_func.track_persistent_value(bind_name, value)
 
 def is_runtime_only_param(_param):
@@ -563,7 +597,7 @@ def _validate_allowed_values(param_definition, value):
     param_name = param_definition.get(PARAM_NAME, 'unknown')
     
     # Only validate TEXT, NUMBER, and LIST params
-    if param_type not in (PARAM_TYPE_TEXT, PARAM_TYPE_NUMBER, PARAM_TYPE_LIST):
+    if param_type not in _ALLOWED_VALUES_PARAM_TYPES:
         return
     
     # Delegate to type-specific validator
@@ -902,7 +936,8 @@ def _get_param_definition_by_alias(alias):
 def _get_param_definition_by_bind_name(bind_name):
     """Get parameter definition by config bind name.
     
-    Searches all parameters for one whose bind name matches.
+    Uses the bind name cache when its entry is still registered, otherwise
+    searches all parameters for one whose bind name matches and caches it.
     
     Args:
         bind_name: Config bind name to look up.
@@ -910,8 +945,14 @@ def _get_param_definition_by_bind_name(bind_name):
     Returns:
         Parameter definition dict or None if not found.
     """
+    param_def = _bind_name_params.get(bind_name)
+    if (param_def is not None
+            and _params.get(param_def[PARAM_NAME]) is param_def
+            and _get_bind_name(param_def) == bind_name):
+        return param_def
     for param_def in _params.values():
         if _get_bind_name(param_def) == bind_name:
+            _bind_name_params[bind_name] = param_def
             return param_def
     return None
 
@@ -1020,12 +1061,13 @@ def param_in_args(param_name, args):
     if not param:
         return False
     
-    aliases = param.get(PARAM_ALIASES, [])
+    aliases = set(param.get(PARAM_ALIASES, []))
+    if not aliases:
+        return False
     for arg in args:
-        # Check exact match or --param=value format
-        for alias in aliases:
-            if arg == alias or arg.startswith(alias + '='):
-                return True
+        # Check exact match or --param=value format with one set lookup per arg
+        if arg.partition('=')[0] in aliases:
+            return True
     return False
 
 def _process_param_aliases(_param):
@@ -1153,8 +1195,7 @@ def _validate_prompt_repeat(repeat_value):
     Raises:
         ValueError: If repeat value is not valid.
     """
-    valid_repeats = (PROMPT_REPEAT_ALWAYS, PROMPT_REPEAT_IF_BLANK, PROMPT_REPEAT_NEVER)
-    if repeat_value not in valid_repeats:
+    if repeat_value not in _PROMPT_REPEAT_VALUES:
         raise ValueError(
             "PARAM_PROMPT_REPEAT must be one of: PROMPT_REPEAT_ALWAYS, "
             "PROMPT_REPEAT_IF_BLANK, PROMPT_REPEAT_NEVER"
@@ -1226,7 +1267,8 @@ def _register_param_alias(param, alias):
     """
     if not is_alias(alias):
         raise ValueError(f"Invalid alias format: {alias}")
-    _param_aliases[alias] = param[PARAM_NAME]
+    # Interned so CLI lookups with interned tokens match on identity
+    _param_aliases[sys.intern(alias)] = param[PARAM_NAME]
 
 
 def _get_bind_name(param):
@@ -1595,6 +1637,18 @@ def get_pre_parse_args():
     return result
 
 
+def get_pre_parse_names():
+    """Get the names of registered pre-parse params.
+    
+    Reads the registered names directly rather than building the full
+    definition list, for callers that only need membership checks.
+    
+    Returns:
+        Set of pre-parse param names that have a registered definition.
+    """
+    return {param_name for param_name in _preparse_args if param_name in _params}
+
+
 def get_all_param_definitions():
     """Accessor function to retrieve all parameter definitions."""
     return _params.values()
@@ -2001,36 +2055,26 @@ def _get_switch_change_behavior(param_definition):
     return param_definition.get(PARAM_SWITCH_CHANGE_BEHAVIOR, SWITCH_REJECT)
 
 
-def _has_switch_conflict(param_definition, xor_param_bind_name):
+def _has_switch_conflict(xor_param_bind_name):
     """Check if a param in the switch group has a conflicting value.
     
-    During registration mode (_SWITCH_REGISTER), always returns False
-    to skip validation while setting defaults.
-    
     Args:
-        param_definition: Definition of param being set
         xor_param_bind_name: Bind name of other param to check
         
     Returns:
         True if conflict exists, False otherwise
     """
-    # Get current behavior mode
-    behavior = _get_switch_change_behavior(param_definition)
-    
-    # Skip conflict detection entirely during registration
-    if behavior == _SWITCH_REGISTER:
-        return False
-    
     existing_value = config.get_config_value(xor_param_bind_name)
+    if existing_value is None:
+        return False
     
     # Look up the conflicting param's definition
     conflicting_param_def = _get_param_definition_by_bind_name(xor_param_bind_name)
     
     # Check type of conflicting param (not param being set)
-    if _is_toggle_param(conflicting_param_def):
+    if conflicting_param_def is not None and _is_toggle_param(conflicting_param_def):
         return existing_value is True
-    else:
-        return existing_value is not None
+    return True
 
 
 def _resolve_switch_conflict(bind_name, xor_param_bind_name, behavior):
@@ -2058,7 +2102,9 @@ def _apply_switch_behavior_to_group(param_definition, value_to_set, behavior):
     """Apply switch change behaviour to other params in switch group.
     
     Checks each param in the switch group for conflicts. If conflicts exist,
-    applies the specified behaviour (UNSET, RESET, or REJECT).
+    applies the specified behaviour (UNSET, RESET, or REJECT). During
+    registration mode (_SWITCH_REGISTER), conflict detection is skipped
+    while setting defaults.
     
     Args:
         param_definition: Definition of param being set
@@ -2068,6 +2114,10 @@ def _apply_switch_behavior_to_group(param_definition, value_to_set, behavior):
     Raises:
         ValueError: If behavior is SWITCH_REJECT and conflicts exist
     """
+    # Skip conflict detection entirely during registration
+    if behavior == _SWITCH_REGISTER:
+        return
+    
     bind_name = param_definition.get(PARAM_CONFIG_NAME) or param_definition.get(PARAM_NAME)
     xor_params = get_xor_params(bind_name)
     
@@ -2081,7 +2131,7 @@ def _apply_switch_behavior_to_group(param_definition, value_to_set, behavior):
             continue
         
         # Check for conflict
-        if _has_switch_conflict(param_definition, xor_param_bind_name):
+        if _has_switch_conflict(xor_param_bind_name):
             _resolve_switch_conflict(bind_name, xor_param_bind_name, behavior)
 
 
@@ -2147,6 +2197,19 @@ def set_param(param_name=None, bind_name=None, alias=None, value=None):
     if param_definition is None:
         raise ValueError("Unknown parameter: '{}'".format(param_name or bind_name or alias))
     
+    _set_param_definition_value(param_definition, value)
+
+
+def _set_param_definition_value(param_definition, value):
+    """Validate and store a value for an already-resolved parameter.
+    
+    Args:
+        param_definition: Parameter definition dict.
+        value: Value to set.
+    
+    Raises:
+        ValueError: If validation fails or XOR conflict detected
+    """
     # Check immutability - allow initial set, block modification
     _check_immutable(param_definition)
     
@@ -2172,7 +2235,7 @@ def set_param(param_name=None, bind_name=None, alias=None, value=None):
     
     # If param is in a switch list, check for XOR conflicts BEFORE setting value
     # This check respects the global _skip_xor_validation flag set via _set_xor_validation_enabled()
-    if not _skip_xor_validation and len(param_definition.get(PARAM_SWITCH_LIST, [])) > 0:
+    if not _skip_xor_validation and param_definition.get(PARAM_SWITCH_LIST):
         _handle_switch_group_behavior(param_definition, value)
     
     # Log the parameter setting at DEBUG level
@@ -2184,7 +2247,34 @@ def set_param(param_name=None, bind_name=None, alias=None, value=None):
     config.set_config_value(config_key, value)
     
     # Notify persistence layer about the change
-    notify_persistence_change(param_definition[PARAM_NAME], value)
+    _track_persistence_change(param_definition, config_key, value)
+
+
+def _set_config_values(config_values):
+    """Set parameter values from a loaded config mapping.
+    
+    Each key is resolved the same way as set_param(param_name=key). Keys that
+    do not resolve to a registered parameter, and values the parameter
+    rejects, are returned instead of raising so the caller can store them
+    directly.
+    
+    Args:
+        config_values: Dict of parameter names or bind names to values.
+    
+    Returns:
+        Dict of the entries that were not set through the param API.
+    """
+    unset_values = {}
+    for config_key, value in config_values.items():
+        param_definition = _resolve_param_definition(param_name=config_key)
+        if param_definition is None:
+            unset_values[config_key] = value
+            continue
+        try:
+            _set_param_definition_value(param_definition, value)
+        except ValueError:
+            unset_values[config_key] = value
+    return unset_values
 
 
 def set_values(param_values):
@@ -2225,7 +2315,9 @@ def _process_single_param_entry(param_entry):
     alias = param_entry.get("alias")
     value = param_entry.get("value")
     
-    if is_list_param(alias=alias) or is_dict_param(alias=alias):
+    # Resolve the definition once and route on its type
+    param_def = _get_param_definition_by_alias(alias)
+    if param_def and param_def.get(PARAM_TYPE, PARAM_TYPE_TEXT) in _JOINED_PARAM_TYPES:
         join_param(alias=alias, value=value)
     else:
         set_param(alias=alias, value=value)
@@ -2448,7 +2540,7 @@ def join_param(param_name=None, bind_name=None, alias=None, value=None):
     config.set_config_value(config_key, joined_value)
     
     # Notify persistence layer about the change
-    notify_persistence_change(param_definition[PARAM_NAME], joined_value)
+    _track_persistence_change(param_definition, config_key, joined_value)
 
 
 def _check_immutable(param_def):
@@ -2520,7 +2612,7 @@ def unset_param(param_name=None, bind_name=None, alias=None):
     config.remove_config_value(config_bind_name)
     
     # Notify persistence layer about the removal (pass None as value)
-    notify_persistence_change(param_def[PARAM_NAME], None)
+    _track_persistence_change(param_def, config_bind_name, None)
 
 
 def reset_param(param_name=None, bind_name=None, alias=None):
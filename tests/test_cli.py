@@ -484,6 +484,19 @@ def test_parse_command_line_unknown_argument_raises():
     except (ValueError, KeyError) as e:
         assert "unknown-argument" in str(e).lower() or "not found" in str(e).lower()
 
+def test_tokenise_cli_args_keeps_each_arg_intact():
+    """Test that the tokenizer treats each argv entry as a single unit.
+
+    A quoted value containing a dash-prefixed word must stay part of the
+    value rather than being split out as a new alias.
+    """
+    tokenized = cli._tokenise_cli_args(['run', '--name', 'hello -world', '--count=3', 'next'])
+    assert tokenized["params"] == [
+        {"alias": "--name", "value": "hello -world"},
+        {"alias": "--count", "value": "3"},
+    ]
+    assert tokenized["commands"] == ['run', 'next']
+
 def test_load_user_config_file_not_found():
     setup_function()
     spafw37.config._config[CONFIG_INFILE_PARAM] = "nonexistent.json"
@@ -420,6 +420,32 @@ def test_parse_file_value_multiple_files(tmp_path):
     assert result == '{"a":1} {"b":2}'
 
 
+def test_parse_file_value_reads_repeated_file_once(tmp_path, monkeypatch):
+    """Test _parse_file_value reads a repeated @file reference only once.
+
+    When the same file is referenced several times in one value, every
+    occurrence should be replaced but the file should be read a single time.
+    This validates the per-value file contents cache.
+    """
+    setup_function()
+
+    file1 = tmp_path / "repeated.txt"
+    file1.write_text('x')
+
+    read_paths = []
+    original_read = spafw37_file._read_file_raw
+
+    def counting_read(path):
+        read_paths.append(path)
+        return original_read(path)
+
+    monkeypatch.setattr(spafw37_file, '_read_file_raw', counting_read)
+
+    result = cli._parse_file_value(f'@{str(file1)} @{str(file1)}')
+    assert result == 'x x'
+    assert len(read_paths) == 1
+
+
 def test_parse_file_value_no_files():
     """Test _parse_file_value returns value unchanged when no @file references.
     
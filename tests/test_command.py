@@ -257,6 +257,60 @@ def test_commands_have_require_before_and_sequence():
     # Desired order: start-command -> middle-command -> end-command
     assert _queue_names(_get_phase_queue()) == ["start-command", "middle-command", "end-command"]
 
+def test_sort_command_queue_ignores_cached_order_for_replaced_commands():
+    """Test _sort_command_queue re-sorts when the same names are registered again with new relations.
+
+    The cached order for a set of names must not be reused once the registry holds
+    different command definitions for those names.
+    """
+    _reset_command_module()
+    command.add_commands([
+        {COMMAND_NAME: "first", COMMAND_ACTION: simple_action},
+        {COMMAND_NAME: "second", COMMAND_ACTION: simple_action},
+    ])
+    command.queue_commands(["first", "second"])
+    assert _queue_names(_get_phase_queue()) == ["first", "second"]
+
+    _reset_command_module()
+    command.add_commands([
+        {COMMAND_NAME: "first", COMMAND_ACTION: simple_action, COMMAND_GOES_AFTER: ["second"]},
+        {COMMAND_NAME: "second", COMMAND_ACTION: simple_action},
+    ])
+    queue = [command.get_command("first"), command.get_command("second")]
+    command._sort_command_queue(queue)
+    assert _queue_names(queue) == ["second", "first"]
+
+def test_sort_command_queue_sees_relations_edited_through_get_command():
+    """Test _sort_command_queue re-sorts after relations are edited on a registered command.
+
+    get_command() returns the live definition, so assigning or appending to its
+    relation lists must change the next sort rather than reuse a cached order.
+    """
+    _reset_command_module()
+    command.add_commands([
+        {COMMAND_NAME: "a", COMMAND_ACTION: simple_action},
+        {COMMAND_NAME: "b", COMMAND_ACTION: simple_action},
+        {COMMAND_NAME: "c", COMMAND_ACTION: simple_action},
+    ])
+    queue = [command.get_command("a"), command.get_command("b")]
+    command._sort_command_queue(queue)
+    assert _queue_names(queue) == ["a", "b"]
+
+    command.get_command("a")[COMMAND_GOES_AFTER] = ["b"]
+    queue = [command.get_command("a"), command.get_command("b")]
+    command._sort_command_queue(queue)
+    assert _queue_names(queue) == ["b", "a"]
+
+    command.get_command("b")[COMMAND_GOES_AFTER] = []
+    queue = [command.get_command("a"), command.get_command("b"), command.get_command("c")]
+    command._sort_command_queue(queue)
+    assert _queue_names(queue) == ["b", "a", "c"]
+
+    command.get_command("b")[COMMAND_GOES_AFTER].append("c")
+    queue = [command.get_command("a"), command.get_command("b"), command.get_command("c")]
+    command._sort_command_queue(queue)
+    assert _queue_names(queue) == ["c", "b", "a"]
+
 def test_circular_dependency_detection():
     """Test that circular dependencies are detected and handled."""
     circular_commands = [
@@ -285,6 +339,31 @@ def test_circular_dependency_detection():
     with pytest.raises(ValueError, match="circular dependency"):
         command.queue_commands(_queue_names(circular_commands))
 
+def test_topological_order_reports_cycle_path():
+    """Test _topological_order names the cycle path when the sort cannot complete."""
+    _reset_command_module()
+    command.add_commands([
+        {COMMAND_NAME: "cmd1", COMMAND_ACTION: simple_action, COMMAND_GOES_AFTER: ["cmd2"]},
+        {COMMAND_NAME: "cmd2", COMMAND_ACTION: simple_action, COMMAND_GOES_AFTER: ["cmd1"]},
+        {COMMAND_NAME: "cmd3", COMMAND_ACTION: simple_action},
+    ])
+
+    with pytest.raises(command.CircularDependencyError, match="cmd1 -> cmd2 -> cmd1"):
+        command._topological_order(["cmd1", "cmd2", "cmd3"])
+
+def test_detect_cycle_handles_paths_deeper_than_recursion_limit():
+    """Test _detect_cycle finds a cycle closing a chain longer than the recursion limit."""
+    import sys
+    chain_length = sys.getrecursionlimit() + 100
+    graph = {index: [index + 1] for index in range(chain_length)}
+    graph[chain_length] = [0]
+
+    cycle_path = command._detect_cycle(graph)
+
+    assert cycle_path[0] == 0
+    assert cycle_path[-1] == 0
+    assert len(cycle_path) == chain_length + 2
+
 def test_missing_command_reference():
     """Test handling of references to non-existent commands."""
     commands_with_missing_ref = [
@@ -680,6 +759,26 @@ def test_queue_add_skips_finished_commands():
     assert len(_get_phase_queue()) == 0
 
 
+def test_queue_add_handles_chain_deeper_than_recursion_limit():
+    """Test _queue_add queues a dependency chain longer than the recursion limit.
+
+    Each command goes after the previous one, so every command is reached
+    through the one before it. This validates that queuing does not recurse.
+    """
+    import sys
+    _reset_command_module()
+    chain_length = sys.getrecursionlimit() + 100
+    for index in range(chain_length):
+        cmd = {COMMAND_NAME: "cmd-{}".format(index), COMMAND_ACTION: simple_action}
+        if index:
+            cmd[COMMAND_GOES_AFTER] = ["cmd-{}".format(index - 1)]
+        command.add_command(cmd)
+
+    command._queue_add("cmd-{}".format(chain_length - 1), set())
+
+    assert len(command._command_queue) == chain_length
+
+
 def test_queue_command_raises_for_goes_before_not_found():
     """Test queue_command raises KeyError when GOES_BEFORE target not found.
     
@@ -1710,3 +1809,20 @@ def test_add_command_conflicting_inline_and_top_level_cycles_raises():
     assert 'conflicting' in error_msg or 'conflict' in error_msg
     assert 'test-cmd' in str(exc_info.value)
 
+
+
+def test_get_command_relations_normalises_missing_relations():
+    """Test _get_command_relations returns name tuples with empty tuples for missing keys.
+
+    Relations are normalised once and reused until the definition changes.
+    """
+    _reset_command_module()
+    command.add_commands([
+        {COMMAND_NAME: "before-cmd", COMMAND_ACTION: simple_action},
+        {COMMAND_NAME: "related-cmd", COMMAND_ACTION: simple_action,
+         COMMAND_GOES_AFTER: ["before-cmd"], COMMAND_NEXT_COMMANDS: None},
+    ])
+
+    relations = command._get_command_relations(command.get_command("related-cmd"))
+
+    assert relations == (("before-cmd",), (), (), ())
@@ -84,6 +84,66 @@ def test_load_config_file(tmp_path):
     loaded_config = config.load_config(str(config_file))
     assert loaded_config == config_data
 
+def test_load_config_reuses_parse_until_file_changes(tmp_path):
+    """Test load_config serves unchanged files from its cache without sharing nested values.
+
+    Mutating a returned list must not leak into later loads, and rewriting the
+    file must be picked up.
+    """
+    import json
+    import os
+    import time
+    from unittest.mock import patch
+    config_file = tmp_path / "cached.json"
+    config_file.write_text(json.dumps({"items": ["a"]}))
+    # Files modified within the last few seconds are never cached
+    old_time = time.time() - 60
+    os.utime(str(config_file), (old_time, old_time))
+
+    first = config.load_config(str(config_file))
+    first["items"].append("b")
+    with patch('spafw37.config_func.json.loads') as mock_loads, \
+         patch('spafw37.config_func.spafw37_file._validate_file_for_reading') as mock_validate:
+        second = config.load_config(str(config_file))
+    mock_loads.assert_not_called()
+    mock_validate.assert_not_called()
+    assert second == {"items": ["a"]}
+
+    config_file.write_text(json.dumps({"items": ["a", "c"]}))
+    assert config.load_config(str(config_file)) == {"items": ["a", "c"]}
+
+def test_load_config_cache_hit_checks_read_permission(tmp_path):
+    """Test load_config raises PermissionError for a cached file that is no longer readable.
+
+    A cache hit skips the binary sniff but not the readability check.
+    """
+    import os
+    import time
+    from unittest.mock import patch
+    config_file = tmp_path / "revoked.json"
+    config_file.write_text('{"key": "value"}')
+    old_time = time.time() - 60
+    os.utime(str(config_file), (old_time, old_time))
+    assert config.load_config(str(config_file)) == {"key": "value"}
+
+    with patch('os.access', return_value=False):
+        try:
+            config.load_config(str(config_file))
+            assert False, "Should have raised PermissionError"
+        except PermissionError:
+            pass
+
+def test_load_config_does_not_cache_recently_modified_file(tmp_path):
+    """Test load_config re-reads a file modified within the timestamp granularity window.
+
+    A same-size rewrite in that window would keep the same stat key.
+    """
+    config_file = tmp_path / "fresh.json"
+    config_file.write_text('{"key": "a"}')
+
+    assert config.load_config(str(config_file)) == {"key": "a"}
+    assert str(config_file) not in config._config_file_cache
+
 def test_save_and_load_user_config(tmp_path):
     """Test saving and loading user configuration through param API.
     
@@ -143,6 +203,25 @@ def test_filter_temporary_config():
     assert "persistent_param_bind" in filtered_config
     assert filtered_config["persistent_param_bind"] == "persistent_value"
 
+def test_save_config_skips_write_when_only_non_persisted_values(tmp_path):
+    """Test save_config writes nothing when every key is non-persisted.
+
+    This validates that the persisted-values check matches filter_temporary_config.
+    """
+    param.add_param({
+        PARAM_NAME: "skip_write_param",
+        PARAM_CONFIG_NAME: "skip_write_bind",
+        PARAM_TYPE: "text",
+        PARAM_PERSISTENCE: PARAM_PERSISTENCE_NEVER
+    })
+    config_file = tmp_path / "skipped.json"
+
+    config.save_config(str(config_file), {"skip_write_bind": "value"})
+    assert not config_file.exists()
+
+    config.save_config(str(config_file), {"skip_write_bind": "value", "kept": 1})
+    assert config_file.exists()
+
 def test_manage_config_persistence():
     """Test persistence management through param API.
     
@@ -203,6 +282,28 @@ def test_load_persistent_config(tmp_path):
     retrieved_value = spafw37.config.get_config_value("persistent_param_bind")
     assert retrieved_value == "persistent_value"
 
+def test_load_persistent_config_if_present_skips_missing_file(tmp_path):
+    """Test load_persistent_config_if_present does nothing when the file is absent.
+
+    A first run without a persistent config file should not attempt to load it
+    or change any config state.
+    """
+    from unittest.mock import patch
+    _persistent_config.clear()
+    _persistent_config["existing"] = "kept"
+    spafw37.config._config.clear()
+    spafw37.config._config["runtime"] = "kept"
+    original_config_file = config._config_file
+    config._config_file = str(tmp_path / "missing.json")
+    try:
+        with patch('spafw37.config_func.load_config') as mock_load:
+            config.load_persistent_config_if_present()
+        mock_load.assert_not_called()
+    finally:
+        config._config_file = original_config_file
+    assert _persistent_config == {"existing": "kept"}
+    assert spafw37.config._config == {"runtime": "kept"}
+
 def test_save_persistent_config(tmp_path):
     """Test saving persistent config through param API.
     
@@ -473,3 +574,93 @@ def test_load_config_unicode_decode_error(tmp_path):
         assert False, "Should have raised UnicodeDecodeError"
     except UnicodeDecodeError as error:
         assert config_file.name in str(error)
+
+def test_save_config_unserialisable_value_keeps_existing_file(tmp_path):
+    """Test save_config leaves the existing file intact when serialisation fails.
+
+    Serialisation happens before the file is opened for writing.
+    """
+    config_file = tmp_path / "keep.json"
+    config_file.write_text('{"kept": 1}')
+
+    try:
+        config.save_config(str(config_file), {"bad": object()})
+        assert False, "Should have raised TypeError"
+    except TypeError:
+        pass
+
+    assert config_file.read_text() == '{"kept": 1}'
+
+def test_save_config_skips_unchanged_and_replaces_changed(tmp_path):
+    """Test save_config leaves an identical file alone and swaps in changed content.
+
+    Changed content is written to a temporary file and moved into place.
+    """
+    config_file = tmp_path / "atomic.json"
+    config.save_config(str(config_file), {"key": "value"})
+    first_inode = config_file.stat().st_ino
+
+    config.save_config(str(config_file), {"key": "value"})
+    assert config_file.stat().st_ino == first_inode
+
+    config.save_config(str(config_file), {"key": "changed"})
+    assert config.load_config(str(config_file)) == {"key": "changed"}
+    assert [path.name for path in tmp_path.iterdir()] == ["atomic.json"]
+
+def test_save_config_preserves_file_mode(tmp_path):
+    """Test save_config keeps the permissions of an existing config file.
+
+    The temporary file that replaces the config must not widen its mode.
+    """
+    import os
+    import stat
+    config_file = tmp_path / "private.json"
+    config_file.write_text('{"secret": "old"}')
+    os.chmod(str(config_file), 0o600)
+
+    config.save_config(str(config_file), {"secret": "new"})
+
+    assert stat.S_IMODE(config_file.stat().st_mode) == 0o600
+    assert config.load_config(str(config_file)) == {"secret": "new"}
+
+def test_save_config_writes_through_symlink(tmp_path):
+    """Test save_config updates the target of a symlinked config file.
+
+    The link itself must stay a link rather than being replaced by a file.
+    """
+    import os
+    target_file = tmp_path / "real.json"
+    target_file.write_text('{}')
+    link_file = tmp_path / "link.json"
+    os.symlink(str(target_file), str(link_file))
+
+    config.save_config(str(link_file), {"key": "value"})
+
+    assert link_file.is_symlink()
+    assert config.load_config(str(target_file)) == {"key": "value"}
+
+def test_load_config_accepts_utf8_bom(tmp_path):
+    """Test load_config parses a UTF-8 file that starts with a byte order mark.
+
+    The file is read as bytes and json.loads detects the encoding itself.
+    """
+    config_file = tmp_path / "bom.json"
+    config_file.write_bytes(b'\xef\xbb\xbf{"key": "value"}')
+
+    assert config.load_config(str(config_file)) == {"key": "value"}
+
+def test_set_config_values_returns_unregistered_entries():
+    """Test param._set_config_values sets registered params and returns the rest.
+
+    Config loaders store the returned entries directly in config.
+    """
+    param.add_param({
+        PARAM_NAME: "bulk_param",
+        PARAM_CONFIG_NAME: "bulk_param_bind",
+        PARAM_TYPE: "text"
+    })
+
+    unset_values = param._set_config_values({"bulk_param_bind": "set", "unregistered_key": 1})
+
+    assert unset_values == {"unregistered_key": 1}
+    assert spafw37.config.get_config_value("bulk_param_bind") == "set"
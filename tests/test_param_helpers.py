@@ -374,3 +374,15 @@ def test_is_list_param_for_dict_type():
     setup_function()
     dict_param = {'name': 'mydict', 'type': 'dict'}
     assert param._is_param_type(dict_param, 'list') is False
+
+
+def test_get_pre_parse_names_returns_registered_names_only():
+    """Test get_pre_parse_names returns names of registered pre-parse params.
+    
+    Names added as pre-parse args without a registered param should be skipped.
+    This validates the membership set used by CLI pre-parsing.
+    """
+    setup_function()
+    param.add_param({param_consts.PARAM_NAME: 'quiet', param.PARAM_ALIASES: ['--quiet']})
+    param.add_pre_parse_args(['quiet', 'unregistered'])
+    assert param.get_pre_parse_names() == {'quiet'}
@@ -79,6 +79,26 @@ def test_get_param_definition_by_bind_name_not_found():
     assert result is None
 
 
+def test_get_param_definition_by_bind_name_ignores_stale_cache():
+    """Test _get_param_definition_by_bind_name ignores cached defs that are no longer registered.
+
+    Should return the currently registered definition after the registry is reset.
+    This validates that the bind name cache cannot return a stale definition.
+    """
+    setup_function()
+    param.add_param({PARAM_NAME: 'cached-param', PARAM_TYPE: PARAM_TYPE_TEXT})
+    first = param._get_param_definition_by_bind_name('cached-param')
+
+    setup_function()
+    assert param._get_param_definition_by_bind_name('cached-param') is None
+
+    param.add_param({PARAM_NAME: 'cached-param', PARAM_TYPE: PARAM_TYPE_NUMBER})
+    result = param._get_param_definition_by_bind_name('cached-param')
+
+    assert result is not first
+    assert result[PARAM_TYPE] == PARAM_TYPE_NUMBER
+
+
 # Tests for _resolve_param_definition()
 def test_resolve_param_definition_by_param_name():
     """Test _resolve_param_definition finds param by parameter name.